@@ -13,10 +13,12 @@ Log level is configurable via config/monitors.yaml:
 Logs rotate when they exceed 1MB in size.
 """
 
+import atexit
 import logging
 import os
+import queue
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Optional
 
@@ -198,6 +200,7 @@ class UsageFormatter(logging.Formatter):
 
 
 _usage_logger: Optional[logging.Logger] = None
+_usage_listener: Optional[QueueListener] = None
 
 
 def get_usage_logger() -> UsageLogAdapter:
@@ -213,7 +216,7 @@ def get_usage_logger() -> UsageLogAdapter:
     Returns:
         Logger adapter with IP/action context support
     """
-    global _usage_logger
+    global _usage_logger, _usage_listener
 
     if _usage_logger is None:
         _usage_logger = logging.getLogger("competitor_agent_usage")
@@ -222,7 +225,14 @@ def get_usage_logger() -> UsageLogAdapter:
         # File handler with custom formatter
         formatter = UsageFormatter(USAGE_FORMAT, DATE_FORMAT)
         file_handler = _create_handler(USAGE_LOG_FILE, formatter)
-        _usage_logger.addHandler(file_handler)
+
+        # The dashboard logs on nearly every click; callers only enqueue the record and a
+        # background listener does the file writes (drained on interpreter exit)
+        log_queue = queue.SimpleQueue()
+        _usage_listener = QueueListener(log_queue, file_handler)
+        _usage_listener.start()
+        atexit.register(_usage_listener.stop)
+        _usage_logger.addHandler(QueueHandler(log_queue))
 
         # Prevent propagation
         _usage_logger.propagate = False
@@ -431,12 +441,17 @@ def get_client_ip() -> str:
     """
     Extract client IP from Streamlit context headers.
 
-    Returns the client IP if available, otherwise 'unknown'.
+    Returns the session's cached IP (see init_client_ip) when set, else the IP
+    from the request headers if available, otherwise 'unknown'.
     Works with Streamlit's st.context.headers (1.37+).
     """
     try:
         import streamlit as st
 
+        # Already resolved for this session by init_client_ip()
+        if "client_ip" in st.session_state:
+            return st.session_state.client_ip
+
         # Use st.context.headers (Streamlit 1.37+)
         headers = st.context.headers
         if headers:
@@ -456,10 +471,6 @@ def get_client_ip() -> str:
             if host and ":" in host:
                 return host.split(":")[0]
 
-        # Fallback: try to get from session state if stored
-        if hasattr(st, "session_state") and "client_ip" in st.session_state:
-            return st.session_state.client_ip
-
     except Exception:
         pass
 
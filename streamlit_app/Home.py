@@ -1,15 +1,16 @@
 # streamlit_app/Home.py
 import os
 import sys
-import subprocess
+import json
 import signal
+import threading
 import time
-from html import escape
 from pathlib import Path
 import re
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from io import BytesIO
-from typing import Dict
+from typing import BinaryIO, Callable, Dict, List
 
 # Add project root to Python path for imports
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
@@ -18,9 +19,9 @@ sys.path.insert(0, str(PROJECT_ROOT))
 from dotenv import load_dotenv
 load_dotenv(PROJECT_ROOT / ".env")  # Load .env file from project root
 
+import numpy as np
 import pandas as pd
 import streamlit as st
-import yaml
 from openai import OpenAI
 from dateutil import parser as dateparser
 
@@ -55,8 +56,12 @@ from reportlab.pdfgen import canvas
 # --------------------------- Constants ---------------------------
 DATA_ENRICHED = "data/enriched_updates.csv"
 DATA_RAW = "data/updates.csv"
+# CSV columns load_data keeps; everything else (e.g. clean_text) is skipped at parse time
+LOAD_COLS = {"company", "title", "summary", "category", "impact", "source_url",
+             "published_at", "collected_at", "date_ref"}
 LOGO_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "assets", "member_solutions_logo.png"))
 SCAN_LOCK_FILE = "data/.scan_in_progress.lock"
+CONFIG_PATH = "config/monitors.yaml"
 
 st.set_page_config(page_title="Competitor Updates", layout="wide")
 
@@ -72,8 +77,36 @@ if "logged_page_view" not in st.session_state:
     log_user_action(client_ip, "page_view", "Dashboard loaded")
 
 # --------------------------- Scan State Management ---------------------------
+SCAN_STATE_TTL_S = 1.0  # how long a scan liveness probe is reused across reruns
+DATA_CACHE_VERSION = 6  # bump when load_data adds/changes derived columns so stale parquet sidecars are ignored
+
 def is_scan_running() -> bool:
-    """Check if a scan is currently in progress by checking lock file."""
+    """Check if a scan is in progress, reusing this session's last probe for SCAN_STATE_TTL_S."""
+    now = time.monotonic()
+    cached = st.session_state.get("_scan_state")
+    if cached and now - cached[0] < SCAN_STATE_TTL_S:
+        return cached[1]
+    running = _probe_scan_running()
+    st.session_state["_scan_state"] = (now, running)
+    return running
+
+def _probe_scan_running() -> bool:
+    """Check if a scan is in progress via this session's Popen handle, else the lock file.
+
+    The lock file (PID probe) only covers scans started from another session or before a restart.
+    """
+    proc = st.session_state.get("_scan_proc")
+    if proc is not None:
+        if proc.poll() is None:
+            return True
+        # Exited (poll() also reaped it): drop the handle and the now-stale lock
+        st.session_state.pop("_scan_proc", None)
+        try:
+            os.remove(SCAN_LOCK_FILE)
+        except FileNotFoundError:
+            pass
+        return False
+
     if os.path.exists(SCAN_LOCK_FILE):
         try:
             with open(SCAN_LOCK_FILE, "r") as f:
@@ -103,30 +136,41 @@ def is_scan_running() -> bool:
     return False
 
 def get_scan_pid() -> int | None:
-    """Get the PID of the running scan process."""
-    if os.path.exists(SCAN_LOCK_FILE):
-        try:
-            with open(SCAN_LOCK_FILE, "r") as f:
-                return int(f.read().strip())
-        except (ValueError, FileNotFoundError):
-            return None
-    return None
+    """Get the PID of the running scan process (re-read only when the lock file changes)."""
+    try:
+        mtime = os.stat(SCAN_LOCK_FILE).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    cached = st.session_state.get("_scan_pid")
+    if cached and cached[0] == mtime:
+        return cached[1]
+    try:
+        with open(SCAN_LOCK_FILE, "r") as f:
+            pid = int(f.read().strip())
+    except (ValueError, FileNotFoundError):
+        pid = None
+    st.session_state["_scan_pid"] = (mtime, pid)
+    return pid
 
 def start_scan() -> bool:
     """Start a new scan process in the background."""
-    if is_scan_running():
+    import subprocess
+
+    # Probe directly: a cached "not running" must not allow a double start
+    if _probe_scan_running():
         return False
 
     client_ip = get_client_ip()
     try:
-        # Start the scan process
+        # Start the scan process. Output is discarded, not piped: this session keeps the handle,
+        # and unread pipes would fill and block the scan (it logs to system.log anyway)
         if sys.platform == "win32":
             # Windows: use CREATE_NEW_PROCESS_GROUP for proper process management
             proc = subprocess.Popen(
                 [sys.executable, "-m", "jobs.daily_scan"],
                 cwd=os.getcwd(),
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 creationflags=subprocess.CREATE_NEW_PROCESS_GROUP,
             )
         else:
@@ -134,16 +178,20 @@ def start_scan() -> bool:
             proc = subprocess.Popen(
                 [sys.executable, "-m", "jobs.daily_scan"],
                 cwd=os.getcwd(),
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 start_new_session=True,
             )
 
-        # Write lock file with PID
+        # Keep the handle so this session checks liveness with proc.poll()
+        st.session_state["_scan_proc"] = proc
+
+        # Write lock file with PID (cross-session fallback)
         os.makedirs(os.path.dirname(SCAN_LOCK_FILE), exist_ok=True)
         with open(SCAN_LOCK_FILE, "w") as f:
             f.write(str(proc.pid))
 
+        st.session_state.pop("_scan_state", None)
         logger.info(f"Scan started by user, PID: {proc.pid}")
         log_user_action(client_ip, "scan_start", f"Started scan process PID={proc.pid}")
         return True
@@ -155,16 +203,24 @@ def start_scan() -> bool:
 
 def cancel_scan() -> bool:
     """Cancel the running scan process."""
-    pid = get_scan_pid()
+    import subprocess
+
+    proc = st.session_state.pop("_scan_proc", None)
+    pid = proc.pid if proc is not None else get_scan_pid()
     if pid is None:
         return False
 
     client_ip = get_client_ip()
     try:
-        if sys.platform == "win32":
-            # Windows: use taskkill to terminate process tree
+        if proc is not None and proc.poll() is not None:
+            pass  # already exited; nothing to signal
+        elif sys.platform == "win32":
+            # Windows: use taskkill to terminate process tree (crawler browsers included)
             subprocess.run(["taskkill", "/F", "/T", "/PID", str(pid)],
                          capture_output=True, check=False)
+        elif proc is not None:
+            # Unix: our handle started a new session, so its PID is the process group ID
+            os.killpg(proc.pid, signal.SIGTERM)
         else:
             # Unix: send SIGTERM to process group
             os.killpg(os.getpgid(pid), signal.SIGTERM)
@@ -175,6 +231,7 @@ def cancel_scan() -> bool:
         except FileNotFoundError:
             pass
 
+        st.session_state.pop("_scan_state", None)
         logger.info(f"Scan cancelled by user, PID: {pid}")
         log_user_action(client_ip, "scan_cancel", f"Cancelled scan process PID={pid}")
         return True
@@ -189,6 +246,18 @@ def cancel_scan() -> bool:
             pass
         return False
 
+@st.cache_resource
+def _enrichment_lock() -> threading.Lock:
+    """Process-wide lock shared across sessions, so only one enrichment subprocess runs at a time."""
+    return threading.Lock()
+
+def _release_after_exit(proc, lock: threading.Lock) -> None:
+    """Keep draining an enrichment job's output until it exits, then release the enrichment lock."""
+    try:
+        proc.communicate()  # an unread pipe would fill up and block the job forever
+    finally:
+        lock.release()
+
 # Initialize session state for scan confirmation dialogs
 if "scan_dialog_state" not in st.session_state:
     st.session_state.scan_dialog_state = None  # None, "confirm_scan", "confirm_cancel"
@@ -237,12 +306,22 @@ if scan_running:
         # Read last N lines from system.log
         try:
             if os.path.exists(SYSTEM_LOG_PATH):
-                with open(SYSTEM_LOG_PATH, "r", encoding="utf-8") as f:
-                    lines = f.readlines()
+                # Re-read only when the file changed since this session's last render
+                stat = os.stat(SYSTEM_LOG_PATH)
+                log_key = (stat.st_mtime_ns, stat.st_size)
+                cached = st.session_state.get("_log_tail")
+                if cached and cached[0] == log_key:
+                    log_text = cached[1]
+                else:
+                    # Only read the last 64KB; plenty for 30 lines regardless of total log size
+                    with open(SYSTEM_LOG_PATH, "rb") as f:
+                        f.seek(max(0, stat.st_size - 65536))
+                        tail = f.read().decode("utf-8", "replace")
                     # Get last 30 lines
-                    recent_lines = lines[-30:] if len(lines) > 30 else lines
-                    log_text = "".join(recent_lines)
-                    st.code(log_text, language="log")
+                    recent_lines = tail.splitlines()[-30:]
+                    log_text = "\n".join(recent_lines)
+                    st.session_state["_log_tail"] = (log_key, log_text)
+                st.code(log_text, language="log")
             else:
                 st.info("No log file found yet. Logs will appear once the scan starts processing.")
         except Exception as e:
@@ -278,7 +357,7 @@ if st.session_state.scan_dialog_state == "confirm_scan":
                 st.session_state.confirmation_text = ""
                 st.success("Scan started! The page will refresh to show progress.")
                 time.sleep(1)
-                st.cache_data.clear()
+                st.session_state["_reload_data"] = True
                 st.rerun()
             else:
                 st.error("Failed to start scan. A scan may already be in progress.")
@@ -315,7 +394,7 @@ elif st.session_state.scan_dialog_state == "confirm_cancel":
                 st.session_state.confirmation_text = ""
                 st.success("Scan cancelled.")
                 time.sleep(1)
-                st.cache_data.clear()
+                st.session_state["_reload_data"] = True
                 st.rerun()
             else:
                 st.error("Failed to cancel scan.")
@@ -328,9 +407,9 @@ elif st.session_state.scan_dialog_state == "confirm_cancel":
 
     st.divider()
 
-# Reload button (clears Streamlit cache)
+# Reload button (load_data is defined further down, so flag the reload for it to pick up)
 if st.button("Reload Data", key="reload_button"):
-    st.cache_data.clear()
+    st.session_state["_reload_data"] = True
     st.rerun()
 
 # --------------------------- Helpers ---------------------------
@@ -350,16 +429,112 @@ def _parse_datetime_to_utc(value):
         return pd.NaT
 
 
-@st.cache_data(show_spinner=False)
+@st.cache_resource(show_spinner=False, max_entries=1)  # only the current file version is kept
+def _load_config_cached(mtime_ns: int) -> dict:
+    """Parse monitors.yaml once per file version (keyed on mtime).
+
+    The dict is shared by every session: treat it as read-only and copy anything you edit in place.
+    """
+    import yaml
+
+    with open(CONFIG_PATH, "r", encoding="utf-8") as cfg_file:
+        # libyaml's C parser when available; same safe semantics as yaml.safe_load
+        return yaml.load(cfg_file, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)) or {}
+
+
+def _get_webhook_port() -> int:
+    """Webhook port from monitors.yaml, served from the mtime-keyed config cache."""
+    try:
+        cfg = _load_config_cached(os.stat(CONFIG_PATH).st_mtime_ns)
+        return cfg.get("global", {}).get("webhook_port", 8001)
+    except Exception:
+        return 8001
+
+
+def _nonblank_lines(text: str) -> List[str]:
+    """Stripped, non-empty lines of a text area (LF or CRLF line endings)."""
+    return [line for line in map(str.strip, text.splitlines()) if line]
+
+def _atomic_write(path: str, write: Callable[[BinaryIO], None]) -> None:
+    """Run write(fh) into path + ".tmp" through one large buffer, fdatasync it, then atomically swap it into place."""
+    tmp_path = path + ".tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    with os.fdopen(fd, "wb", buffering=1 << 20) as fh:
+        write(fh)
+        fh.flush()
+        # Data (not metadata) durability is all the rename needs; fdatasync is POSIX-only
+        getattr(os, "fdatasync", os.fsync)(fh.fileno())
+    os.replace(tmp_path, path)
+
+def _write_config_atomic(config: dict) -> None:
+    """Dump config to YAML and atomically replace monitors.yaml with it."""
+    import yaml
+
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    text = yaml.dump(config, Dumper=dumper, default_flow_style=False, allow_unicode=True, sort_keys=False)
+    _atomic_write(CONFIG_PATH, lambda fh: fh.write(text.encode("utf-8")))
+
+
+def _parquet_cache_path(csv_path: str) -> str:
+    """Sidecar parquet path for a source CSV (e.g. data/.enriched_updates.cache-v6.parquet)."""
+    folder, name = os.path.split(csv_path)
+    return os.path.join(folder, f".{os.path.splitext(name)[0]}.cache-v{DATA_CACHE_VERSION}.parquet")
+
+
+@st.cache_data(ttl=60, show_spinner=False)
 def load_data():
-    """Load enriched if present, else raw; normalize timestamps and required cols."""
+    """Load enriched if present, else raw, via a parquet sidecar that is rebuilt when the CSV changes.
+
+    The TTL picks up CSVs rewritten by a finished scan or enrichment; explicit reloads call
+    load_data.clear() so the other caches (notably the OpenAI summaries) survive.
+    """
     path = DATA_ENRICHED if os.path.exists(DATA_ENRICHED) else DATA_RAW
-    df = pd.read_csv(path)
+    cache_path = _parquet_cache_path(path)
+    try:
+        if os.path.exists(cache_path) and os.stat(cache_path).st_mtime_ns > os.stat(path).st_mtime_ns:
+            return pd.read_parquet(cache_path), path
+    except Exception as e:
+        logger.warning(f"Ignoring parquet cache {cache_path}: {e}")
+
+    df = _load_csv_normalized(path)
+    try:
+        tmp_path = cache_path + ".tmp"
+        df.to_parquet(tmp_path, compression="zstd")
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        logger.warning(f"Could not write parquet cache {cache_path}: {e}")
+    return df, path
+
+
+def _to_utc_datetime(values: pd.Series) -> pd.Series:
+    """Parse timestamps to datetime64[ns, UTC]: ISO8601 in one vectorized pass, dateutil for the rest."""
+    parsed = pd.to_datetime(values, errors="coerce", utc=True, format="ISO8601")
+    # Rare non-ISO strings (e.g. RFC 2822 dates from feeds) fall back to dateutil, row by row
+    retry = parsed.isna() & values.notna() & values.astype(str).str.strip().ne("")
+    if retry.any():
+        parsed[retry] = pd.to_datetime(values[retry].map(_parse_datetime_to_utc), errors="coerce", utc=True)
+    return parsed
+
+def _blank_mask(col: pd.Series) -> np.ndarray:
+    """Blank/NaN test per row; categoricals test their few categories and index by code."""
+    if isinstance(col.dtype, pd.CategoricalDtype):
+        blank = np.append(col.cat.categories.astype(str).str.strip() == "", True)  # code -1 (NaN) -> blank
+        return blank[col.cat.codes.to_numpy()]
+    return np.char.strip(col.to_numpy(dtype=object, na_value="").astype(str)) == ""
+
+def _load_csv_normalized(path: str) -> pd.DataFrame:
+    """Read a source CSV; normalize timestamps, required cols and derived display/search cols."""
+    # Only the columns the UI uses; label columns are parsed straight into categoricals
+    df = pd.read_csv(
+        path,
+        usecols=lambda c: c in LOAD_COLS,
+        dtype={"company": "category", "category": "category", "impact": "category"},
+    )
 
-    # Normalize datetimes using dateutil parser (handles timezone offsets properly)
+    # Normalize datetimes to UTC (one vectorized ISO8601 parse; see _to_utc_datetime)
     for col in ["published_at", "collected_at"]:
         if col in df.columns:
-            df[col] = df[col].apply(_parse_datetime_to_utc)
+            df[col] = _to_utc_datetime(df[col])
 
     # Ensure required columns exist
     for col, default in [
@@ -372,61 +547,50 @@ def load_data():
         if col not in df.columns:
             df[col] = default
 
+    # Low-cardinality label columns: categorical codes make groupby/isin/nunique cheap
+    # (read_csv already did this for columns present in the file; this covers the defaults)
+    for col in ["company", "category", "impact"]:
+        df[col] = df[col].astype("category")
+    # Display-cased impact label ("High"/"Medium"/"Low", "" when missing) for filters, KPIs and summaries
+    df["impact_title"] = df["impact"].astype(object).fillna("").astype(str).str.strip().str.title().astype("category")
+
+    # Enrichment complete: summary, category and impact all non-blank (QA pool / pending count)
+    df["_enriched"] = ~np.logical_or.reduce([_blank_mask(df[c]) for c in ["summary", "category", "impact"]])
+
     # Unified reference date: prefer collected_at (when we discovered it) for competitive intelligence
     # published_at can be years old for blog archive crawls, which isn't useful for CI
     coll = df.get("collected_at")
     if coll is not None:
         df["date_ref"] = coll
     elif "date_ref" in df.columns:
-        df["date_ref"] = df["date_ref"].apply(_parse_datetime_to_utc)
+        df["date_ref"] = _to_utc_datetime(df["date_ref"])
     else:
         pub = df.get("published_at")
         df["date_ref"] = pub if pub is not None else pd.NaT
 
-    return df, path
+    # Coerce date_ref to datetime64[ns, UTC] once and pre-format the display string,
+    # so reruns never re-parse or re-strftime the column
+    if not pd.api.types.is_datetime64_any_dtype(df["date_ref"]):
+        df["date_ref"] = pd.to_datetime(df["date_ref"], errors="coerce", utc=True)
+    df["_date_str"] = df["date_ref"].dt.strftime("%m-%d-%Y")
 
-def impact_badge(val):
-    """Render nice badge or empty string if no impact yet."""
-    if pd.isna(val):
-        return ""
-    txt = str(val).strip().title()
-    if not txt or txt in {"Nan", "Na"}:
-        return ""
-    color = {"High": "red", "Medium": "orange", "Low": "gray"}.get(txt, "gray")
-    return f'<span style="background:{color};color:white;padding:2px 8px;border-radius:12px;font-size:12px;">{txt}</span>'
-
-def clickable_title(title: str, url: str) -> str:
-    from urllib.parse import quote
-
-    t = escape((title or "").strip() or "View")
-    u = (url or "").strip()
-    if not u:
-        return t
-
-    # For email entries, link to the webhook email viewer
-    if u.startswith("email://"):
-        email_id = u.replace("email://", "")
-        # URL-encode the email ID to handle special characters like = and +
-        email_id_encoded = quote(email_id, safe="")
-        # Get webhook port from config
-        config_path = Path("config/monitors.yaml")
-        webhook_port = 8001
-        if config_path.exists():
-            try:
-                with open(config_path, "r", encoding="utf-8") as f:
-                    cfg = yaml.safe_load(f) or {}
-                    webhook_port = cfg.get("global", {}).get("webhook_port", 8001)
-            except Exception:
-                pass
-        u = f"http://localhost:{webhook_port}/email/view/{email_id_encoded}"
+    # Highlight text for executive summaries: summary, falling back to title when blank
+    title_s = df["title"].fillna("").astype(str).str.strip()
+    df["_highlight"] = df["summary"].fillna("").astype(str).str.strip().where(lambda s: s.ne(""), title_s)
+
+    # Lowercased title + summary haystack for the sidebar search box
+    df["_search_hay"] = (df["title"].fillna("").astype(str) + " " + df["summary"].fillna("").astype(str)).str.lower()
 
-    return f'<a href="{escape(u)}" target="_blank" rel="noopener">{t}</a>'
+    # Newest first, once: filter masks keep this order, so the feed/export never re-sort
+    return df.sort_values("date_ref", ascending=False, kind="stable", na_position="last").reset_index(drop=True)
+
+_WS_RE = re.compile(r"\s+")
 
 def _condense_words(text: str, max_words: int = 28) -> str:
     """Return a compact sentence capped at ~max_words, cleaned and ellipsized."""
     if not text:
         return ""
-    text = re.sub(r"\s+", " ", str(text)).strip(" \t\n\r-–—")
+    text = _WS_RE.sub(" ", str(text)).strip(" \t\n\r-–—")
     words = text.split()
     if len(words) <= max_words:
         return text
@@ -435,24 +599,48 @@ def _condense_words(text: str, max_words: int = 28) -> str:
 # OpenAI client for summaries
 client = OpenAI()
 
-def _get_summarize_prompts() -> Dict[str, str]:
-    """Get summarize_point prompts from config."""
-    import yaml
-    config_path = "config/monitors.yaml"
+_SUMMARIZE_PROMPT_DEFAULTS = {
+    "summarize_point": {
+        "system": "You are a professional business summarizer.",
+        "user": "Summarize the following news or blog content in a single concise paragraph of about {max_words} words. Make it clear, factual, and self-contained:\n\n{text}"
+    },
+    "summarize_points": {
+        "system": "You are a professional business summarizer.",
+        "user": "Summarize each of the following {count} numbered news or blog items in a single concise paragraph of about {max_words} words each. Make each summary clear, factual, and self-contained.\nReturn JSON of the form {{\"summaries\": [...]}} with exactly {count} strings, in the same order as the items.\n\n{items}"
+    },
+}
+
+def _get_summarize_prompts(key: str = "summarize_point") -> Dict[str, str]:
+    """Get summarize_point / summarize_points prompts from config."""
     try:
-        if os.path.exists(config_path):
-            with open(config_path, "r", encoding="utf-8") as f:
-                config = yaml.safe_load(f) or {}
-            prompts = config.get("prompts", {}).get("summarize_point", {})
+        if os.path.exists(CONFIG_PATH):
+            config = _load_config_cached(os.stat(CONFIG_PATH).st_mtime_ns)
+            prompts = config.get("prompts", {}).get(key, {})
             if prompts:
                 return prompts
     except Exception:
         pass
     # Defaults
-    return {
-        "system": "You are a professional business summarizer.",
-        "user": "Summarize the following news or blog content in a single concise paragraph of about {max_words} words. Make it clear, factual, and self-contained:\n\n{text}"
-    }
+    return _SUMMARIZE_PROMPT_DEFAULTS[key]
+
+@st.cache_data(show_spinner=False, persist="disk", max_entries=10_000)
+def _chat_completion_cached(system_prompt: str, user_prompt: str, max_tokens: int, json_mode: bool = False) -> str:
+    """gpt-4o-mini completion persisted to disk by prompt, so identical summaries are never re-requested.
+
+    API errors propagate (and so are never cached); callers handle the fallback.
+    """
+    kwargs = {"response_format": {"type": "json_object"}} if json_mode else {}
+    resp = client.chat.completions.create(
+        model="gpt-4o-mini",
+        temperature=0.3,
+        max_tokens=max_tokens,
+        messages=[
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ],
+        **kwargs,
+    )
+    return (resp.choices[0].message.content or "").strip()
 
 def summarize_point(text: str, max_words: int = 50) -> str:
     """Uses GPT to generate a clean 1–2 sentence summary (~50 words)."""
@@ -464,23 +652,56 @@ def summarize_point(text: str, max_words: int = 50) -> str:
     user_prompt = prompts["user"].format(max_words=max_words, text=text)
 
     try:
-        resp = client.chat.completions.create(
-            model="gpt-4o-mini",
-            temperature=0.3,
-            max_tokens=120,
-            messages=[
-                {"role": "system", "content": prompts["system"]},
-                {"role": "user", "content": user_prompt},
-            ],
-        )
-        return resp.choices[0].message.content.strip()
+        return _chat_completion_cached(prompts["system"], user_prompt, max_tokens=120)
     except Exception as e:
         print("Summarization failed:", e)
         return text[:300]  # fallback
 
+def summarize_points(texts: List[str], max_words: int = 50) -> List[str]:
+    """Summarize several texts with a single JSON-mode request; results keep input order.
+
+    Falls back to one summarize_point call per text if the batched reply can't be used.
+    """
+    texts = [t.strip() for t in texts if (t or "").strip()]
+    if len(texts) <= 1:
+        return [summarize_point(t, max_words=max_words) for t in texts]
+
+    prompts = _get_summarize_prompts("summarize_points")
+    items = "\n\n".join(f"{i}. {t}" for i, t in enumerate(texts, start=1))
+    user_prompt = prompts["user"].format(count=len(texts), max_words=max_words, items=items)
+
+    try:
+        raw = _chat_completion_cached(prompts["system"], user_prompt, max_tokens=120 * len(texts), json_mode=True)
+        data = json.loads(raw or "{}")
+        summaries = [str(x).strip() for x in data.get("summaries", [])]
+        if len(summaries) == len(texts):
+            return summaries
+        logger.warning(f"Batch summarization returned {len(summaries)} of {len(texts)} items; falling back")
+    except Exception as e:
+        logger.warning(f"Batch summarization failed: {e}")
+    return [summarize_point(t, max_words=max_words) for t in texts]
+
+def _build_exec_block(company, posts: int, impact: dict, top_topics: list, texts: list) -> dict:
+    """Summary block for one company from its precomputed aggregates."""
+    # Refine highlight sentences (short, ~50 words) in one batched request per company
+    refined = [s for s in summarize_points(texts, max_words=50) if s]
+
+    return {
+        "company": company,
+        "posts": posts,
+        "impact": impact,
+        "top_topics": top_topics,
+        "highlights": refined
+    }
+
 def build_exec_blocks(filtered_df: pd.DataFrame, max_highlights: int = 3, progress_callback=None):
     """Create structured summary blocks from the current filtered data.
 
+    Counts, top topics and highlight texts for every company come from a few grouped passes
+    over the whole frame; each company's highlights are then summarized in one batched request,
+    with companies running concurrently (the OpenAI calls are I/O bound). Blocks are returned
+    sorted by company.
+
     Args:
         filtered_df: DataFrame with competitor data
         max_highlights: Max highlight sentences per company
@@ -490,54 +711,60 @@ def build_exec_blocks(filtered_df: pd.DataFrame, max_highlights: int = 3, progre
     if filtered_df.empty:
         return blocks
 
-    companies = list(filtered_df.groupby("company"))
-    total = len(companies)
-
-    for idx, (company, g) in enumerate(companies):
-        if progress_callback:
-            progress_callback(idx, total, company)
-
-        posts = len(g)
-
-        # Impact counts
-        ic = g.get("impact", pd.Series([], dtype=object)).astype(str).str.title()
-        impact = {k: int(ic.eq(k).sum()) for k in ["High", "Medium", "Low"]}
-
-        # Top topics
-        top_topics = []
-        if "category" in g.columns:
-            cats = (g["category"].astype(str).str.strip().replace({"": "Uncategorized"})
-                    .value_counts().head(3))
-            top_topics = list(cats.items())  # [(name, count), ...]
-
-        # Highlight sentences: prefer 'summary'; fallback to 'title'
-        texts = (
-            g.apply(lambda r: (str(r.get("summary", "")).strip()
-                               or str(r.get("title", "")).strip()), axis=1)
-             .head(max_highlights)
-             .tolist()
-        )
-
-        # Refine highlight sentences with summarize_point (short, ~50 words)
-        refined = []
-        for t in texts:
-            s = summarize_point(t, max_words=50)
-            if s:
-                refined.append(s)
-
-        blocks.append({
-            "company": company,
-            "posts": posts,
-            "impact": impact,
-            "top_topics": top_topics,
-            "highlights": refined
-        })
+    by_company = filtered_df.groupby("company", observed=True)
+    posts = by_company.size()
+
+    # Impact counts
+    impact = (filtered_df.groupby(["company", "impact_title"], observed=True).size()
+              .unstack(fill_value=0)
+              .reindex(index=posts.index, columns=["High", "Medium", "Low"], fill_value=0))
+
+    # Top topics (blank category counts as Uncategorized)
+    topic = filtered_df["category"].astype(str).str.strip().replace({"": "Uncategorized"}).rename("topic")
+    topic_counts = (filtered_df.groupby([filtered_df["company"], topic], observed=True).size()
+                    .sort_values(ascending=False, kind="stable")
+                    .groupby(level=0, observed=True).head(3))
+    top_topics = {}
+    for (company, name), cnt in topic_counts.items():
+        top_topics.setdefault(company, []).append((name, int(cnt)))
+
+    # Highlight sentences: prefer 'summary'; fallback to 'title' (precomputed as _highlight)
+    first_rows = by_company.head(max_highlights)
+    texts = {}
+    for company, text in zip(first_rows["company"], first_rows["_highlight"]):
+        texts.setdefault(company, []).append(text)
+
+    total = len(posts)
+    with ThreadPoolExecutor(max_workers=min(8, total)) as ex:
+        futures = {
+            ex.submit(
+                _build_exec_block,
+                company,
+                int(posts[company]),
+                {k: int(v) for k, v in impact.loc[company].items()},
+                top_topics.get(company, []),
+                texts.get(company, []),
+            ): company
+            for company in posts.index
+        }
+        for done, fut in enumerate(as_completed(futures), start=1):
+            blocks.append(fut.result())
+            if progress_callback:
+                progress_callback(done, total, futures[fut])
+
+    blocks.sort(key=lambda b: str(b["company"]))
 
     if progress_callback:
         progress_callback(total, total, "Done")
 
     return blocks
 
+@st.cache_resource(show_spinner=False, max_entries=1)  # only the current logo version is kept
+def _logo_reader(mtime_ns: int):
+    """Decode the header logo once per file version (keyed on mtime); returns (reader, width, height)."""
+    img = ImageReader(LOGO_PATH)
+    return (img, *img.getSize())
+
 def exec_blocks_to_pdf(blocks, daterange_label: str = "") -> bytes:
     """Render the executive summary blocks into a PDF and return bytes (with logo header)."""
     buf = BytesIO()
@@ -578,85 +805,168 @@ def exec_blocks_to_pdf(blocks, daterange_label: str = "") -> bytes:
 
         elements.append(Spacer(1, 0.2 * inch))
 
-    # Header (logo top-right)
+    # Header (logo top-right): logo decoded and placement computed once, not on every page
+    header = None
+    try:
+        if os.path.exists(LOGO_PATH):
+            img, iw, ih = _logo_reader(os.stat(LOGO_PATH).st_mtime_ns)
+            page_w, page_h = doc.pagesize
+            target_w = 120
+            target_h = target_w * (ih / iw)
+            header = (img, page_w - target_w - 36, page_h - target_h - 18, target_w, target_h)
+    except Exception as e:
+        logger.warning(f"Logo load failed: {e}")
+
     def _header(cv, _doc):
+        if header is None:
+            return
+        img, x, y, target_w, target_h = header
         try:
-            if os.path.exists(LOGO_PATH):
-                page_w, page_h = _doc.pagesize
-                img = ImageReader(LOGO_PATH)
-                iw, ih = img.getSize()
-                target_w = 120
-                target_h = target_w * (ih / iw)
-                x = page_w - target_w - 36
-                y = page_h - target_h - 18
-                cv.drawImage(
-                    LOGO_PATH, x, y,
-                    width=target_w, height=target_h,
-                    mask='auto', preserveAspectRatio=True, anchor='n'
-                )
+            cv.drawImage(
+                img, x, y,
+                width=target_w, height=target_h,
+                mask='auto', preserveAspectRatio=True, anchor='n'
+            )
         except Exception as e:
             print("Logo draw failed:", e)
 
     doc.build(elements, onFirstPage=_header, onLaterPages=_header)
+    # getvalue() on a finished BytesIO hands back its buffer without a second copy
     pdf = buf.getvalue()
     buf.close()
     return pdf
 
+@st.cache_data(show_spinner=False, max_entries=4)
+def _exec_pdf_cached(blocks_json: str, daterange_label: str = "") -> bytes:
+    """exec_blocks_to_pdf memoized on the serialized blocks, so reruns reuse the rendered PDF."""
+    return exec_blocks_to_pdf(json.loads(blocks_json), daterange_label)
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _chart_axes(chart_start, chart_end, companies_key: tuple):
+    """Quarter labels spanning the chart range, plus the sorted company list."""
+    all_quarters = []
+    if chart_start and chart_end:
+        all_quarters = pd.period_range(
+            start=pd.Timestamp(chart_start).to_period("Q"),
+            end=pd.Timestamp(chart_end).to_period("Q"),
+            freq="Q"
+        ).astype(str).tolist()
+    return all_quarters, sorted(companies_key)
+
+
+@st.cache_data(ttl=300, max_entries=8, show_spinner=False)
+def _build_quarter_frame(fq_all: pd.DataFrame, chart_start, chart_end):
+    """Posts per (quarter, company) within the chart range, zero-filled across all quarters/companies.
+
+    Returns (g, all_quarters); g is None when no rows fall inside the range.
+    """
+    # Companies come from the full dataset for consistent colors
+    all_quarters, all_companies = _chart_axes(chart_start, chart_end, tuple(fq_all["company"].unique()))
+
+    fq = fq_all
+    if chart_start and chart_end:
+        chart_start_utc = pd.Timestamp(chart_start).tz_localize("UTC")
+        chart_end_utc = pd.Timestamp(chart_end).tz_localize("UTC") + pd.Timedelta(days=1)
+        fq = fq[(fq["date_ref"] >= chart_start_utc) & (fq["date_ref"] < chart_end_utc)]
+
+    if fq.empty:
+        return None, all_quarters
+
+    # date_ref is datetime64[ns, UTC]; its numpy view is already naive UTC, so bucket directly
+    quarter = pd.DatetimeIndex(fq["date_ref"].to_numpy("datetime64[ns]")).to_period("Q").astype(str)
+    counts = fq.assign(quarter=quarter).groupby(["quarter", "company"], observed=True).size()
+
+    # Zero-fill every quarter x company pair with a single reindex of the counts
+    # (product order is already quarter-then-company, so no re-sort is needed)
+    if all_quarters and all_companies:
+        full_index = pd.MultiIndex.from_product([all_quarters, all_companies], names=["quarter", "company"])
+        counts = counts.reindex(full_index, fill_value=0)
+
+    # "YYYYQn" strings sort chronologically, so groupby's key order is already correct
+    g = counts.rename("posts").reset_index()
+    return g, all_quarters
+
+
+@st.cache_data(ttl=300, max_entries=8, show_spinner=False)
+def _build_display_frame(sorted_f: pd.DataFrame, webhook_port: int) -> pd.DataFrame:
+    """Build the Dashboard feed table from the newest-first frame: formatted dates, email:// links rewritten."""
+    show_cols = [c for c in ["date_ref", "company", "title", "category", "impact", "source_url", "summary"] if c in sorted_f.columns]
+    # One projection (reindex yields an owned frame, not a flagged slice); date_ref is
+    # inserted as the pre-formatted string rather than copied and overwritten
+    display = sorted_f.reindex(columns=[c for c in show_cols if c != "date_ref"])
+    if "date_ref" in show_cols:
+        display.insert(0, "date_ref", sorted_f["_date_str"])
+
+    # One batched fill (object first: fillna("") is invalid on the categorical columns)
+    fill_cols = [c for c in ["category", "summary", "title", "company", "source_url", "impact"] if c in display.columns]
+    display[fill_cols] = display[fill_cols].astype(object).fillna("")
+
+    if "category" in display.columns:
+        blank_cat = display["category"].astype(str).str.strip().eq("")
+        display.loc[blank_cat, "category"] = "Uncategorized"
+
+    # Transform email:// URLs to actual HTTP links for the email viewer
+    if "source_url" in display.columns:
+        from urllib.parse import quote
+
+        urls = display["source_url"].astype(str).str.strip()
+        is_email = urls.str.startswith("email://")
+        if is_email.any():
+            # Only the (few) email rows need per-item URL-encoding
+            email_ids = urls[is_email].str.slice(len("email://")).map(lambda x: quote(x, safe=""))
+            urls.loc[is_email] = f"http://localhost:{webhook_port}/email/view/" + email_ids
+        display["source_url"] = urls
+
+    # Reorder and prepare columns for display
+    ui_cols = [c for c in ["date_ref", "company", "title", "category", "impact", "summary", "source_url"] if c in display.columns]
+    return display[ui_cols]
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _df_to_csv_bytes(df: pd.DataFrame, chunksize: int = 10_000) -> bytes:
+    """Serialize df to UTF-8, LF-terminated CSV bytes via a binary buffer (no intermediate str copy)."""
+    buf = BytesIO()
+    df.to_csv(buf, index=False, encoding="utf-8", lineterminator="\n", chunksize=chunksize)
+    return buf.getvalue()
+
+
 def render_feed(f: pd.DataFrame):
     """Render the feed table from the current filtered frame `f`."""
     st.divider()
     st.subheader("Feed")
-    st.write("Click a title to open the source; summaries appear if enrichment is complete.")
+    st.caption(f"Showing {len(f)} articles")
 
     if f.empty:
         st.info("No rows in the current selection.")
         return
 
-    show_cols = [c for c in ["date_ref", "company", "title", "category", "impact", "source_url", "summary"] if c in f.columns]
-    if not show_cols:
+    display = _build_display_frame(f, _get_webhook_port())
+    if display.columns.empty:
         st.info("Feed cannot render because required columns are missing.")
         return
 
-    sorted_f = f.sort_values(by=["date_ref"], ascending=False)
-    display = sorted_f[show_cols].copy()
-
-    # format / cleanup
-    if "date_ref" in display.columns:
-        display["date_ref"] = pd.to_datetime(display["date_ref"], errors="coerce", utc=True).dt.strftime("%m-%d-%Y")
-
-    for c in [c for c in ["category", "summary", "title", "company", "source_url", "impact"] if c in display.columns]:
-        display[c] = display[c].astype(object).where(display[c].notna(), "")
-
-    if "category" in display.columns:
-        display["category"] = display["category"].apply(lambda s: s if str(s).strip() else "Uncategorized")
-
-    # clickable title + hide raw title/source_url in UI
-    if {"title", "source_url"}.issubset(display.columns):
-        title_link_series = pd.Series(
-            [clickable_title(t, u) for t, u in zip(display["title"], display["source_url"])],
-            index=display.index,
-            name="title_link",
-            dtype="object",
-        )
-        display = display.assign(title_link=title_link_series)
-        display = display.drop(columns=["source_url", "title"], errors="ignore")
-        ui_cols = [c for c in ["date_ref", "company", "title_link", "category", "impact", "summary"] if c in display.columns]
-        display = display[ui_cols]
-
-    # impact badge
-    if "impact" in display.columns:
-        display["impact"] = display["impact"].apply(impact_badge)
-
-    # Render
-    st.markdown(
-        display.to_html(escape=False, index=False)
-        .replace('<table', '<table style="word-wrap:break-word;white-space:normal;table-layout:fixed;width:100%;"')
-        .replace('<td', '<td style="word-wrap:break-word;white-space:normal;"'),
-        unsafe_allow_html=True,
+    # st.dataframe renders client-side (virtualized), no per-cell HTML building
+    st.dataframe(
+        display,
+        use_container_width=True,
+        height=400,
+        column_config={
+            "date_ref": st.column_config.TextColumn("Date", width="small"),
+            "company": st.column_config.TextColumn("Company", width="small"),
+            "title": st.column_config.TextColumn("Title", width="medium"),
+            "category": st.column_config.TextColumn("Category", width="small"),
+            "impact": st.column_config.TextColumn("Impact", width="small"),
+            "summary": st.column_config.TextColumn("Summary", width="large"),
+            "source_url": st.column_config.LinkColumn("Link", width="small", display_text="Open"),
+        },
+        hide_index=True,
     )
 
 
 # --------------------------- Load & Sidebar ---------------------------
+if st.session_state.pop("_reload_data", False):
+    load_data.clear()
 df, src_path = load_data()
 st.caption(f"Data source: `{src_path}` • Rows: {len(df):,}")
 
@@ -670,7 +980,7 @@ with st.expander("Debug: data health", expanded=False):
         else:
             st.write(f"{col}: MISSING COLUMN")
     if st.button("Hard refresh data cache", key="debug_refresh"):
-        st.cache_data.clear()
+        load_data.clear()
         st.rerun()
 
 # --------------------------- Filter Change Tracking ---------------------------
@@ -711,20 +1021,21 @@ def log_filter_change(filter_name: str, old_val, new_val):
         logger.debug(f"Filter '{filter_name}' changed: {old_val} -> {new_val}")
 
 st.sidebar.header("Filters")
-companies = sorted([c for c in df["company"].dropna().unique()])
+# Categories of the loaded categoricals are already the sorted, non-null distinct values
+companies = list(df["company"].cat.categories)
 sel_companies = st.sidebar.multiselect("Company", companies, default=companies)
 
-categories = sorted([c for c in df["category"].dropna().unique()])
+categories = list(df["category"].cat.categories)
 sel_categories = st.sidebar.multiselect("Category", categories, default=categories)
 
 impacts = ["High", "Medium", "Low"]
 if "impact" in df.columns:
-    present_impacts = sorted({str(x).title() for x in df["impact"].dropna().unique() if str(x).strip()})
+    present_impacts = sorted(x for x in df["impact_title"].unique() if x)
     impacts = [i for i in ["High", "Medium", "Low"] if i in present_impacts] or present_impacts or impacts
 sel_impacts = st.sidebar.multiselect("Impact", impacts, default=impacts)
 
-min_date = pd.to_datetime(df["date_ref"].min(), errors="coerce", utc=True)
-max_date = pd.to_datetime(df["date_ref"].max(), errors="coerce", utc=True)
+min_date = df["date_ref"].min()  # already datetime64[ns, UTC] from load_data
+max_date = df["date_ref"].max()
 
 # Read date range from URL query params (persists across reloads)
 qp = st.query_params
@@ -782,33 +1093,33 @@ st.session_state.prev_filters = {
 }
 
 # --------------------------- Filtered Frame ---------------------------
-f = df.copy()
+# One boolean mask over the loaded frame, sliced once (isin on categoricals matches on codes)
+mask = np.ones(len(df), dtype=bool)
 if sel_companies:
-    f = f[f["company"].isin(sel_companies)]
-if sel_categories and "category" in f:
-    f = f[f["category"].isin(sel_categories)]
-if sel_impacts and "impact" in f:
-    f = f[f["impact"].astype(str).str.title().isin(sel_impacts)]
+    mask &= df["company"].isin(sel_companies).to_numpy()
+if sel_categories and "category" in df:
+    mask &= df["category"].isin(sel_categories).to_numpy()
+if sel_impacts and "impact" in df:
+    mask &= df["impact_title"].isin(sel_impacts).to_numpy()
 
 # Date range
-if pd.api.types.is_datetime64_any_dtype(f["date_ref"]) and date_from and date_to:
+if pd.api.types.is_datetime64_any_dtype(df["date_ref"]) and date_from and date_to:
     start_utc = pd.Timestamp(date_from).tz_localize("UTC")
     end_utc = pd.Timestamp(date_to).tz_localize("UTC") + pd.Timedelta(days=1)  # inclusive
-    f = f[(f["date_ref"] >= start_utc) & (f["date_ref"] < end_utc)]
+    dr = df["date_ref"].to_numpy("datetime64[ns]")  # NaT compares False
+    mask &= (dr >= start_utc.to_datetime64()) & (dr < end_utc.to_datetime64())
 
 # Title/summary search
 if query.strip():
     q = query.lower()
-    hay = (f["title"].fillna("") + " " + f.get("summary", pd.Series([""] * len(f))).fillna(""))
-    f = f[hay.str.lower().str.contains(q, regex=False, na=False)]
+    mask &= df["_search_hay"].str.contains(q, regex=False, na=False).to_numpy()
+
+f = df.loc[mask]  # keeps load_data's newest-first order
 
 # =====================================================================
 # SETTINGS PAGE (shown when gear icon is clicked)
 # =====================================================================
 if st.session_state.show_settings:
-    import yaml
-    import copy
-
     # Back button
     if st.button("← Back to Dashboard", key="btn_back_to_main", type="primary"):
         st.session_state.show_settings = False
@@ -822,248 +1133,234 @@ if st.session_state.show_settings:
 
     # ===================== CONFIGURATION TAB =====================
     with settings_tab1:
-        CONFIG_PATH = "config/monitors.yaml"
-
         def load_yaml_config():
             try:
-                with open(CONFIG_PATH, "r", encoding="utf-8") as cfg_file:
-                    return yaml.safe_load(cfg_file)
+                return _load_config_cached(os.stat(CONFIG_PATH).st_mtime_ns)
             except Exception as e:
                 st.error(f"Failed to load config: {e}")
                 return None
 
-        # Initialize session state for config editing
-        if "config_competitors" not in st.session_state:
-            config = load_yaml_config()
-            if config:
-                st.session_state.config_competitors = copy.deepcopy(config.get("competitors", []))
-            else:
-                st.session_state.config_competitors = []
-
         config = load_yaml_config()
 
+        # Initialize session state for config editing: an editable copy of the competitors
+        # (entries are flat, so copying each dict and its URL list is enough to detach it from the cache)
+        if "config_competitors" not in st.session_state:
+            st.session_state.config_competitors = [
+                {**c, "start_urls": list(c.get("start_urls", []))}
+                for c in (config or {}).get("competitors", [])
+            ]
+
         if config:
-            # Global Settings
-            st.subheader("Global Settings")
+            # Global settings, the competitors grid and alert settings are edited in one form:
+            # typing only reruns the page when the form is submitted (saved)
+            with st.form("settings_config_form", border=False):
+                # Global Settings
+                st.subheader("Global Settings")
 
-            col1, col2 = st.columns(2)
+                col1, col2 = st.columns(2)
 
-            with col1:
-                current_log_level = config.get("global", {}).get("log_level", "INFO")
-                log_level_options = ["DEBUG", "INFO", "WARNING", "ERROR"]
-                try:
-                    log_level_index = log_level_options.index(current_log_level.upper())
-                except ValueError:
-                    log_level_index = 1
-                new_log_level = st.selectbox(
-                    "Log Level",
-                    options=log_level_options,
-                    index=log_level_index,
-                    help="DEBUG: Verbose logging. INFO: Normal operation.",
-                    key="settings_log_level"
-                )
+                with col1:
+                    current_log_level = config.get("global", {}).get("log_level", "INFO")
+                    log_level_options = ["DEBUG", "INFO", "WARNING", "ERROR"]
+                    try:
+                        log_level_index = log_level_options.index(current_log_level.upper())
+                    except ValueError:
+                        log_level_index = 1
+                    new_log_level = st.selectbox(
+                        "Log Level",
+                        options=log_level_options,
+                        index=log_level_index,
+                        help="DEBUG: Verbose logging. INFO: Normal operation.",
+                        key="settings_log_level"
+                    )
+
+                    current_timeout = config.get("global", {}).get("request_timeout_s", 20)
+                    new_timeout = st.number_input(
+                        "Request Timeout (seconds)",
+                        min_value=5,
+                        max_value=120,
+                        value=int(current_timeout),
+                        key="settings_timeout"
+                    )
 
-                current_timeout = config.get("global", {}).get("request_timeout_s", 20)
-                new_timeout = st.number_input(
-                    "Request Timeout (seconds)",
-                    min_value=5,
-                    max_value=120,
-                    value=int(current_timeout),
-                    key="settings_timeout"
+                with col2:
+                    current_max_pages = config.get("global", {}).get("max_pages_per_site", 60)
+                    new_max_pages = st.number_input(
+                        "Max Pages Per Site",
+                        min_value=10,
+                        max_value=500,
+                        value=int(current_max_pages),
+                        key="settings_max_pages"
+                    )
+
+                    current_dedupe = config.get("global", {}).get("dedupe_window_days", 365)
+                    new_dedupe = st.number_input(
+                        "Dedupe Window (days)",
+                        min_value=30,
+                        max_value=730,
+                        value=int(current_dedupe),
+                        key="settings_dedupe"
+                    )
+
+                current_ua = config.get("global", {}).get("user_agent", "")
+                new_ua = st.text_input(
+                    "User Agent",
+                    value=current_ua,
+                    key="settings_user_agent"
                 )
 
-            with col2:
-                current_max_pages = config.get("global", {}).get("max_pages_per_site", 60)
-                new_max_pages = st.number_input(
-                    "Max Pages Per Site",
-                    min_value=10,
-                    max_value=500,
-                    value=int(current_max_pages),
-                    key="settings_max_pages"
+                current_follow = config.get("global", {}).get("follow_within_domain_only", True)
+                new_follow = st.checkbox(
+                    "Follow Within Domain Only",
+                    value=current_follow,
+                    key="settings_follow_domain"
                 )
 
-                current_dedupe = config.get("global", {}).get("dedupe_window_days", 365)
-                new_dedupe = st.number_input(
-                    "Dedupe Window (days)",
-                    min_value=30,
-                    max_value=730,
-                    value=int(current_dedupe),
-                    key="settings_dedupe"
+                st.divider()
+
+                # Competitors Management
+                st.subheader("Monitored Competitors")
+                st.caption(f"Currently monitoring {len(st.session_state.config_competitors)} competitors")
+
+                # One grid for all competitors (rows can be added/removed in place) instead of
+                # three widgets per competitor
+                comp_base = st.session_state.config_competitors
+                comp_df = pd.DataFrame({
+                    "name": [c.get("name", "") for c in comp_base],
+                    "start_urls": [" ".join(c.get("start_urls", [])) for c in comp_base],
+                })
+                edited_comp_df = st.data_editor(
+                    comp_df,
+                    num_rows="dynamic",
+                    use_container_width=True,
+                    hide_index=True,
+                    key="settings_comp_editor",
+                    column_config={
+                        "name": st.column_config.TextColumn("Name", width="medium"),
+                        "start_urls": st.column_config.TextColumn("Start URLs (space-separated)", width="large"),
+                    },
                 )
 
-            current_ua = config.get("global", {}).get("user_agent", "")
-            new_ua = st.text_input(
-                "User Agent",
-                value=current_ua,
-                key="settings_user_agent"
-            )
+                # Rows keep their index label, so edited rows map back onto their original entry
+                # (other per-competitor keys survive); blank names are dropped
+                updated_competitors = []
+                for idx, name, urls_str in zip(edited_comp_df.index, edited_comp_df["name"], edited_comp_df["start_urls"]):
+                    name = str(name or "").strip()
+                    if not name:
+                        continue
+                    base = comp_base[int(idx)] if pd.notna(idx) and 0 <= int(idx) < len(comp_base) else {}
+                    updated_competitors.append({**base, "name": name, "start_urls": str(urls_str or "").split()})
+
+                st.divider()
+
+                # Alert Settings
+                with st.expander("Alert Settings", expanded=False):
+                    current_high_impact = config.get("global", {}).get("high_impact_labels", [])
+                    new_high_impact = st.text_area(
+                        "High Impact Labels (one per line)",
+                        value="\n".join(current_high_impact),
+                        height=100,
+                        key="settings_high_impact"
+                    )
 
-            current_follow = config.get("global", {}).get("follow_within_domain_only", True)
-            new_follow = st.checkbox(
-                "Follow Within Domain Only",
-                value=current_follow,
-                key="settings_follow_domain"
-            )
+                    current_alert_levels = config.get("global", {}).get("alert_on_impact_levels", ["High"])
+                    new_alert_levels = st.multiselect(
+                        "Alert on Impact Levels",
+                        options=["High", "Medium", "Low"],
+                        default=[lvl for lvl in current_alert_levels if lvl in ["High", "Medium", "Low"]],
+                        key="settings_alert_levels"
+                    )
 
-            st.divider()
+                st.divider()
+                save_clicked = st.form_submit_button("💾 Save Configuration", type="primary")
 
-            # Competitors Management
-            st.subheader("Monitored Competitors")
-            st.caption(f"Currently monitoring {len(st.session_state.config_competitors)} competitors")
-
-            updated_competitors = []
-            for i, comp in enumerate(st.session_state.config_competitors):
-                with st.container():
-                    col1, col2, col3 = st.columns([2, 3, 0.5])
-                    with col1:
-                        new_name = st.text_input(
-                            "Name" if i == 0 else f"Name###{i}",
-                            value=comp.get("name", ""),
-                            key=f"settings_comp_name_{i}",
-                            label_visibility="visible" if i == 0 else "collapsed"
-                        )
-                    with col2:
-                        urls_str = "\n".join(comp.get("start_urls", []))
-                        new_urls_str = st.text_area(
-                            "Start URLs (one per line)" if i == 0 else f"URLs###{i}",
-                            value=urls_str,
-                            height=68,
-                            key=f"settings_comp_urls_{i}",
-                            label_visibility="visible" if i == 0 else "collapsed"
-                        )
-                    with col3:
-                        st.write("")
-                        if st.button("🗑️", key=f"settings_del_comp_{i}", help=f"Remove {comp.get('name', 'competitor')}"):
-                            st.session_state.config_competitors.pop(i)
-                            st.rerun()
+            if save_clicked:
+                try:
+                    updated_config = {
+                        **config,
+                        "global": {
+                            **config.get("global", {}),
+                            "log_level": new_log_level,
+                            "user_agent": new_ua,
+                            "request_timeout_s": int(new_timeout),
+                            "max_pages_per_site": int(new_max_pages),
+                            "follow_within_domain_only": new_follow,
+                            "dedupe_window_days": int(new_dedupe),
+                            "slack_webhook_env": config.get("global", {}).get("slack_webhook_env", "SLACK_WEBHOOK_URL"),
+                            "high_impact_labels": _nonblank_lines(new_high_impact),
+                            "alert_on_impact_levels": new_alert_levels,
+                        },
+                        "competitors": updated_competitors
+                    }
+                    _write_config_atomic(updated_config)
+                    # Saved list becomes the grid's new base (widget state is dropped when the grid isn't shown)
+                    st.session_state.config_competitors = updated_competitors
+                    st.session_state.pop("settings_comp_editor", None)
+
+                    log_user_action(get_client_ip(), "config_save", f"Saved config: {len(updated_competitors)} competitors")
+                    logger.info(f"Configuration saved: {len(updated_competitors)} competitors")
+                    st.success("✅ Configuration saved!")
+
+                    from app.logger import set_log_level
+                    set_log_level(new_log_level)
+
+                except Exception as e:
+                    st.error(f"Failed to save: {e}")
+                    logger.error(f"Config save failed: {e}")
 
-                    if new_name.strip():
-                        updated_competitors.append({
-                            "name": new_name.strip(),
-                            "start_urls": [u.strip() for u in new_urls_str.strip().split("\n") if u.strip()]
-                        })
+            if st.button("🔄 Reload from File", key="settings_btn_reload"):
+                if "config_competitors" in st.session_state:
+                    del st.session_state.config_competitors
+                st.session_state.pop("settings_comp_editor", None)
+                st.rerun()
 
-            st.session_state.config_competitors = updated_competitors
+            st.divider()
 
-            # Add new competitor
+            # Add new competitor (its own form; inputs clear once submitted)
             st.markdown("**Add New Competitor**")
-            new_comp_col1, new_comp_col2 = st.columns([2, 3])
-            with new_comp_col1:
-                new_comp_name = st.text_input(
-                    "New Competitor Name",
-                    value="",
-                    key="settings_new_comp_name",
-                    placeholder="e.g., Acme Corp"
-                )
-            with new_comp_col2:
-                new_comp_urls = st.text_area(
-                    "Start URLs (one per line)",
-                    value="",
-                    key="settings_new_comp_urls",
-                    height=68,
-                    placeholder="https://example.com/blog"
-                )
+            with st.form("settings_add_comp_form", clear_on_submit=True, border=False):
+                new_comp_col1, new_comp_col2 = st.columns([2, 3])
+                with new_comp_col1:
+                    new_comp_name = st.text_input(
+                        "New Competitor Name",
+                        value="",
+                        key="settings_new_comp_name",
+                        placeholder="e.g., Acme Corp"
+                    )
+                with new_comp_col2:
+                    new_comp_urls = st.text_area(
+                        "Start URLs (one per line)",
+                        value="",
+                        key="settings_new_comp_urls",
+                        height=68,
+                        placeholder="https://example.com/blog"
+                    )
+                add_clicked = st.form_submit_button("➕ Add Competitor")
 
-            if st.button("➕ Add Competitor", key="settings_btn_add_competitor"):
+            if add_clicked:
                 if new_comp_name.strip() and new_comp_urls.strip():
-                    new_urls_list = [u.strip() for u in new_comp_urls.strip().split("\n") if u.strip()]
+                    new_urls_list = _nonblank_lines(new_comp_urls)
                     if new_urls_list:
-                        # Add to session state
-                        st.session_state.config_competitors.append({
+                        # Add to session state (on top of any unsaved grid edits); the grid re-bases on rerun
+                        st.session_state.config_competitors = updated_competitors + [{
                             "name": new_comp_name.strip(),
                             "start_urls": new_urls_list
-                        })
+                        }]
+                        st.session_state.pop("settings_comp_editor", None)
 
                         # Auto-save to YAML file immediately
                         try:
-                            updated_config = {
-                                "global": config.get("global", {}),
-                                "competitors": st.session_state.config_competitors
-                            }
-                            tmp_path = CONFIG_PATH + ".tmp"
-                            with open(tmp_path, "w", encoding="utf-8") as cfg_file:
-                                yaml.dump(updated_config, cfg_file, default_flow_style=False, allow_unicode=True, sort_keys=False)
-                            os.replace(tmp_path, CONFIG_PATH)
+                            _write_config_atomic({**config, "competitors": st.session_state.config_competitors})
                             log_user_action(get_client_ip(), "config_add_competitor", f"Added competitor: {new_comp_name.strip()}")
                             logger.info(f"Added competitor '{new_comp_name.strip()}' and saved to {CONFIG_PATH}")
                             st.success(f"Added '{new_comp_name.strip()}' and saved to config!")
                         except Exception as e:
                             st.error(f"Added to list but failed to save: {e}")
                             logger.error(f"Failed to save config after adding competitor: {e}")
-
-                        # Clear input fields
-                        if "settings_new_comp_name" in st.session_state:
-                            del st.session_state["settings_new_comp_name"]
-                        if "settings_new_comp_urls" in st.session_state:
-                            del st.session_state["settings_new_comp_urls"]
                         st.rerun()
                 else:
                     st.warning("Please enter both a name and at least one URL.")
 
-            st.divider()
-
-            # Alert Settings
-            with st.expander("Alert Settings", expanded=False):
-                current_high_impact = config.get("global", {}).get("high_impact_labels", [])
-                new_high_impact = st.text_area(
-                    "High Impact Labels (one per line)",
-                    value="\n".join(current_high_impact),
-                    height=100,
-                    key="settings_high_impact"
-                )
-
-                current_alert_levels = config.get("global", {}).get("alert_on_impact_levels", ["High"])
-                new_alert_levels = st.multiselect(
-                    "Alert on Impact Levels",
-                    options=["High", "Medium", "Low"],
-                    default=[lvl for lvl in current_alert_levels if lvl in ["High", "Medium", "Low"]],
-                    key="settings_alert_levels"
-                )
-
-            # Save / Reset buttons
-            st.divider()
-            col_save, col_reset = st.columns([1, 1])
-
-            with col_save:
-                if st.button("💾 Save Configuration", type="primary", key="settings_btn_save"):
-                    try:
-                        updated_config = {
-                            "global": {
-                                "log_level": new_log_level,
-                                "user_agent": new_ua,
-                                "request_timeout_s": int(new_timeout),
-                                "max_pages_per_site": int(new_max_pages),
-                                "follow_within_domain_only": new_follow,
-                                "dedupe_window_days": int(new_dedupe),
-                                "slack_webhook_env": config.get("global", {}).get("slack_webhook_env", "SLACK_WEBHOOK_URL"),
-                                "high_impact_labels": [l.strip() for l in new_high_impact.strip().split("\n") if l.strip()],
-                                "alert_on_impact_levels": new_alert_levels,
-                            },
-                            "competitors": st.session_state.config_competitors
-                        }
-
-                        tmp_path = CONFIG_PATH + ".tmp"
-                        with open(tmp_path, "w", encoding="utf-8") as cfg_file:
-                            yaml.dump(updated_config, cfg_file, default_flow_style=False, allow_unicode=True, sort_keys=False)
-                        os.replace(tmp_path, CONFIG_PATH)
-
-                        log_user_action(get_client_ip(), "config_save", f"Saved config: {len(st.session_state.config_competitors)} competitors")
-                        logger.info(f"Configuration saved: {len(st.session_state.config_competitors)} competitors")
-                        st.success("✅ Configuration saved!")
-
-                        from app.logger import set_log_level
-                        set_log_level(new_log_level)
-
-                    except Exception as e:
-                        st.error(f"Failed to save: {e}")
-                        logger.error(f"Config save failed: {e}")
-
-            with col_reset:
-                if st.button("🔄 Reload from File", key="settings_btn_reload"):
-                    if "config_competitors" in st.session_state:
-                        del st.session_state.config_competitors
-                    st.rerun()
-
             # View Raw YAML
             st.divider()
             with st.expander("📄 View Raw YAML", expanded=False):
@@ -1076,12 +1373,9 @@ if st.session_state.show_settings:
 
     # ===================== CATEGORIES TAB =====================
     with settings_tab2:
-        CONFIG_PATH = "config/monitors.yaml"
-
         def load_yaml_config_for_categories():
             try:
-                with open(CONFIG_PATH, "r", encoding="utf-8") as cfg_file:
-                    return yaml.safe_load(cfg_file)
+                return _load_config_cached(os.stat(CONFIG_PATH).st_mtime_ns)
             except Exception as e:
                 st.error(f"Failed to load config: {e}")
                 return None
@@ -1091,13 +1385,14 @@ if st.session_state.show_settings:
         if config_cat:
             classification = config_cat.get("classification", {})
 
-            # Initialize session state for categories
+            # Initialize session state for categories (own copy: the loaded config is shared across
+            # sessions, and the add/delete buttons below edit this list in place)
             if "config_categories" not in st.session_state:
-                st.session_state.config_categories = classification.get("categories", [
+                st.session_state.config_categories = list(classification.get("categories", [
                     "Product/Feature", "Pricing/Plans", "Partnership", "Acquisition/Investment",
                     "Case Study/Customer", "Events/Webinar", "Best Practices/Guides",
                     "Security/Compliance", "Hiring/Leadership", "Company News", "Other"
-                ])
+                ]))
 
             st.subheader("Content Categories")
             st.caption("Categories used by AI to classify competitor content. 'Other' is always included as fallback.")
@@ -1205,17 +1500,14 @@ if st.session_state.show_settings:
                     updated_config["classification"] = {
                         "categories": final_categories,
                         "impact_rules": {
-                            "high": [r.strip() for r in high_rules.strip().split("\n") if r.strip()],
-                            "medium": [r.strip() for r in medium_rules.strip().split("\n") if r.strip()],
-                            "low": [r.strip() for r in low_rules.strip().split("\n") if r.strip()],
+                            "high": _nonblank_lines(high_rules),
+                            "medium": _nonblank_lines(medium_rules),
+                            "low": _nonblank_lines(low_rules),
                         },
                         "industry_context": industry_context.strip()
                     }
 
-                    tmp_path = CONFIG_PATH + ".tmp"
-                    with open(tmp_path, "w", encoding="utf-8") as cfg_file:
-                        yaml.dump(updated_config, cfg_file, default_flow_style=False, allow_unicode=True, sort_keys=False)
-                    os.replace(tmp_path, CONFIG_PATH)
+                    _write_config_atomic(updated_config)
 
                     log_user_action(get_client_ip(), "categories_save", f"Saved {len(final_categories)} categories")
                     logger.info(f"Categories saved: {len(final_categories)} categories")
@@ -1350,15 +1642,7 @@ if st.session_state.show_settings:
 
                 # Create clickable link to email viewer from json_file
                 if "json_file" in recent_display.columns:
-                    config_path = Path("config/monitors.yaml")
-                    webhook_port = 8001
-                    if config_path.exists():
-                        try:
-                            with open(config_path, "r", encoding="utf-8") as cfg_file:
-                                cfg = yaml.safe_load(cfg_file) or {}
-                                webhook_port = cfg.get("global", {}).get("webhook_port", 8001)
-                        except Exception:
-                            pass
+                    webhook_port = _get_webhook_port()
 
                     def make_email_view_url(json_file):
                         if not json_file or pd.isna(json_file):
@@ -1438,64 +1722,74 @@ if st.session_state.show_settings:
 
         # Count pending
         def _pending_enrichment_count(df_check: pd.DataFrame) -> int:
-            cols = [c for c in ["summary", "category", "impact"] if c in df_check.columns]
-            if not cols:
-                return len(df_check)
-            mask = False
-            for c in cols:
-                mask = mask | (df_check[c].astype(str).str.strip() == "")
-            if "category" in df_check.columns:
-                mask = mask & (df_check["category"] != "Uncategorized")
+            # A row is pending if any enrichment cell is blank (precomputed as ~_enriched by load_data)
+            mask = ~df_check["_enriched"].to_numpy()
+            mask &= df_check["category"].to_numpy() != "Uncategorized"
             return int(mask.sum())
 
-        pending_count = _pending_enrichment_count(df) if not df.empty else 0
-        st.metric("Articles Pending Enrichment", pending_count)
+        def _pending_count_capped(df_check: pd.DataFrame, cap: int = 10_000, chunk: int = 65_536):
+            """Count pending rows chunk by chunk, stopping early once the count exceeds the display cap."""
+            total = 0
+            for start in range(0, len(df_check), chunk):
+                total += _pending_enrichment_count(df_check.iloc[start:start + chunk])
+                if total > cap:
+                    return f"{cap:,}+"
+            return total
+
+        pending_count = _pending_count_capped(df) if not df.empty else 0
+        st.metric("Articles Pending Enrichment", str(pending_count))
 
         if st.button("▶️ Run Enrichment Now", type="primary", key="settings_btn_enrich"):
             client_ip = get_client_ip()
             log_user_action(client_ip, "enrichment_start", "Started enrichment job")
-            try:
-                with st.spinner("Running enrichment job…"):
-                    proc = subprocess.run(
-                        [sys.executable, "-m", "jobs.enrich_updates"],
-                        text=True,
-                        capture_output=True,
-                        cwd=os.getcwd(),
-                    )
-                if proc.returncode == 0:
+            lock = _enrichment_lock()
+            if not lock.acquire(blocking=False):
+                st.warning("An enrichment run is already in progress.")
+            else:
+                import subprocess
+
+                proc = None
+                try:
+                    # Stream the job's output into a rolling 3000-char tail while it runs
+                    log_box = st.empty()
+                    tail = ""
+                    with st.spinner("Running enrichment job…"):
+                        proc = subprocess.Popen(
+                            [sys.executable, "-u", "-m", "jobs.enrich_updates"],
+                            cwd=os.getcwd(),
+                            stdout=subprocess.PIPE,
+                            stderr=subprocess.STDOUT,
+                            text=True,
+                            errors="replace",
+                            bufsize=1,
+                        )
+                        for line in proc.stdout:
+                            tail = (tail + line)[-3000:]
+                            log_box.code(tail, language="bash")
+                        returncode = proc.wait()
+                    if returncode != 0:
+                        raise RuntimeError(f"enrichment job exited with code {returncode}")
                     st.success("✅ Enrichment complete!")
                     log_user_action(client_ip, "enrichment_complete", "Completed successfully")
-                    if proc.stdout:
-                        with st.expander("Output", expanded=False):
-                            st.code(proc.stdout[-3000:], language="bash")
-                else:
-                    st.error("Enrichment failed")
-                    log_user_action(client_ip, "enrichment_error", f"Exit code {proc.returncode}")
-                    if proc.stderr:
-                        st.code(proc.stderr[-3000:], language="bash")
-            except Exception as e:
-                st.error(f"Error: {e}")
-                log_user_action(client_ip, "enrichment_error", str(e))
-            finally:
-                st.cache_data.clear()
+                except Exception as e:
+                    st.error(f"Enrichment failed: {e}")
+                    logger.error(f"Enrichment failed: {e}")
+                    log_user_action(client_ip, "enrichment_error", str(e))
+                finally:
+                    if proc is not None and proc.poll() is None:
+                        # Script run interrupted (rerun/navigation): the job keeps going; free the lock when it exits
+                        threading.Thread(target=_release_after_exit, args=(proc, lock), daemon=True).start()
+                    else:
+                        lock.release()
+                    load_data.clear()
 
         st.divider()
 
         st.subheader("QA Sampler")
         st.write("Download a random sample of enriched articles for quality review.")
 
-        # Filter to enriched rows only
-        qf = df.copy()
-        if not qf.empty:
-            for c in ["summary", "category", "impact"]:
-                if c in qf.columns:
-                    qf[c] = qf[c].astype(str)
-            mask = (
-                qf.get("summary", pd.Series([""])).str.strip().ne("") &
-                qf.get("category", pd.Series([""])).str.strip().ne("") &
-                qf.get("impact", pd.Series([""])).str.strip().ne("")
-            )
-            qf = qf[mask]
+        # Enriched rows only (summary, category and impact all non-blank), flagged once by load_data
+        qf = df.loc[df["_enriched"].to_numpy()]
 
         if qf.empty:
             st.info("No enriched articles available for sampling.")
@@ -1510,16 +1804,17 @@ if st.session_state.show_settings:
             with c3:
                 seed = st.number_input("Seed", 1, 9999, 42, key="settings_qa_seed")
 
-            n = max(int(len(qf) * fraction / 100), int(min_rows))
-            sample = qf.sample(n=min(n, len(qf)), random_state=int(seed)).copy()
-            qa_cols = [c for c in ["date_ref", "company", "title", "category", "impact", "summary", "source_url"] if c in sample.columns]
-            sample = sample[qa_cols]
+            n = min(max(int(len(qf) * fraction / 100), int(min_rows)), len(qf))
+            qa_cols = [c for c in ["date_ref", "company", "title", "category", "impact", "summary", "source_url"] if c in qf.columns]
+            # Draw row positions first, then gather only those rows of the QA columns
+            idx = np.random.default_rng(int(seed)).choice(len(qf), size=n, replace=False)
+            sample = qf.iloc[idx, qf.columns.get_indexer(qa_cols)]
 
             st.caption(f"Sample size: {len(sample)} articles")
             qa_fname = f"qa_sample_{pd.Timestamp.now(tz='UTC').strftime('%Y%m%d_%H%M')}.csv"
             st.download_button(
                 "📥 Download QA Sample",
-                data=sample.to_csv(index=False).encode("utf-8"),
+                data=_df_to_csv_bytes(sample),
                 file_name=qa_fname,
                 mime="text/csv",
                 key="settings_btn_qa_download",
@@ -1545,12 +1840,14 @@ with tab_dashboard:
     # KPIs
     col1, col2, col3 = st.columns(3)
     now_utc = pd.Timestamp.now(tz="UTC")
-    last7 = f[(f["date_ref"] >= (now_utc - pd.Timedelta(days=7)))]
-    highs = f[f.get("impact", "").astype(str).str.title().eq("High")] if "impact" in f else f.iloc[0:0]
+    # Count straight off numpy arrays; no intermediate filtered frames
+    dates = f["date_ref"].to_numpy("datetime64[ns]")
+    last7_n = int((dates >= (now_utc - pd.Timedelta(days=7)).to_datetime64()).sum())
+    highs_n = int(f["impact_title"].eq("High").sum())
     with col1:
-        st.metric("New (last 7 days)", len(last7))
+        st.metric("New (last 7 days)", last7_n)
     with col2:
-        st.metric("High-Impact", len(highs))
+        st.metric("High-Impact", highs_n)
     with col3:
         st.metric("Active Competitors", f["company"].nunique())
 
@@ -1558,7 +1855,7 @@ with tab_dashboard:
     st.subheader("Posts per Quarter by Competitor")
 
     # Determine available date range from data
-    fq_all = f[f["date_ref"].notna()].copy()
+    fq_all = f[f["date_ref"].notna()]
     if not fq_all.empty:
         chart_min_date = fq_all["date_ref"].min()
         chart_max_date = fq_all["date_ref"].max()
@@ -1589,47 +1886,9 @@ with tab_dashboard:
                 key="chart_date_to"
             )
 
-        # Filter data by selected chart date range
-        fq = fq_all.copy()
-        if chart_start and chart_end:
-            chart_start_utc = pd.Timestamp(chart_start).tz_localize("UTC")
-            chart_end_utc = pd.Timestamp(chart_end).tz_localize("UTC") + pd.Timedelta(days=1)
-            fq = fq[(fq["date_ref"] >= chart_start_utc) & (fq["date_ref"] < chart_end_utc)]
-
-            # Generate all quarters in the selected date range
-            all_quarters = pd.period_range(
-                start=pd.Timestamp(chart_start).to_period("Q"),
-                end=pd.Timestamp(chart_end).to_period("Q"),
-                freq="Q"
-            ).astype(str).tolist()
-        else:
-            all_quarters = []
-
-        # Get all companies from the full dataset for consistent colors
-        all_companies = sorted(fq_all["company"].unique().tolist())
-
-        if not fq.empty:
-            try:
-                fq["date_ref_naive"] = fq["date_ref"].dt.tz_convert("UTC").dt.tz_localize(None)
-            except Exception:
-                fq["date_ref_naive"] = fq["date_ref"].dt.tz_localize(None)
-
-            fq["quarter"] = fq["date_ref_naive"].dt.to_period("Q").astype(str)
-            g = fq.groupby(["quarter", "company"]).size().reset_index(name="posts")
-
-            # Create complete grid of all quarters x all companies with zeros
-            if all_quarters and all_companies:
-                full_index = pd.MultiIndex.from_product([all_quarters, all_companies], names=["quarter", "company"])
-                full_df = pd.DataFrame(index=full_index).reset_index()
-                full_df["posts"] = 0
-                # Merge actual data
-                g = full_df.merge(g, on=["quarter", "company"], how="left", suffixes=("_default", ""))
-                g["posts"] = g["posts"].fillna(g["posts_default"]).fillna(0).astype(int)
-                g = g[["quarter", "company", "posts"]]
-
-            g["_qsort"] = pd.PeriodIndex(g["quarter"], freq="Q")
-            g = g.sort_values(["_qsort", "company"]).drop(columns=["_qsort"])
+        g, all_quarters = _build_quarter_frame(fq_all, chart_start, chart_end)
 
+        if g is not None:
             try:
                 import altair as alt
                 chart = alt.Chart(g, height=280).mark_bar().encode(
@@ -1650,76 +1909,16 @@ with tab_dashboard:
     else:
         st.info("No rows with a valid date in the current filter selection.")
 
-    # Feed table
-    st.divider()
-    st.subheader("Feed")
-    st.caption(f"Showing {len(f)} articles")
-
-    show_cols = [c for c in ["date_ref", "company", "title", "category", "impact", "source_url", "summary"] if c in f.columns]
-    sorted_f = f.sort_values(by=["date_ref"], ascending=False)
-    display = sorted_f[show_cols].copy()
-
-    if "date_ref" in display.columns:
-        display["date_ref"] = pd.to_datetime(display["date_ref"], errors="coerce", utc=True).dt.strftime("%m-%d-%Y")
-
-    for c in [c for c in ["category", "summary", "title", "company", "source_url", "impact"] if c in display.columns]:
-        display[c] = display[c].astype(object).where(display[c].notna(), "")
-
-    if "category" in display.columns:
-        display["category"] = display["category"].apply(lambda s: s if str(s).strip() else "Uncategorized")
-
-    # Transform email:// URLs to actual HTTP links for the email viewer
-    if "source_url" in display.columns:
-        from urllib.parse import quote
-        config_path = Path("config/monitors.yaml")
-        webhook_port = 8001
-        if config_path.exists():
-            try:
-                with open(config_path, "r", encoding="utf-8") as cfg_file:
-                    cfg = yaml.safe_load(cfg_file) or {}
-                    webhook_port = cfg.get("global", {}).get("webhook_port", 8001)
-            except Exception:
-                pass
-
-        def transform_email_url(url):
-            url = str(url).strip()
-            if url.startswith("email://"):
-                email_id = url.replace("email://", "")
-                email_id_encoded = quote(email_id, safe="")
-                return f"http://localhost:{webhook_port}/email/view/{email_id_encoded}"
-            return url
-
-        display["source_url"] = display["source_url"].apply(transform_email_url)
-
-    # Reorder and prepare columns for display
-    ui_cols = [c for c in ["date_ref", "company", "title", "category", "impact", "summary", "source_url"] if c in display.columns]
-    display = display[ui_cols]
-
-    # Use st.dataframe with column configuration for proper scrollable table
-    st.dataframe(
-        display,
-        use_container_width=True,
-        height=400,
-        column_config={
-            "date_ref": st.column_config.TextColumn("Date", width="small"),
-            "company": st.column_config.TextColumn("Company", width="small"),
-            "title": st.column_config.TextColumn("Title", width="medium"),
-            "category": st.column_config.TextColumn("Category", width="small"),
-            "impact": st.column_config.TextColumn("Impact", width="small"),
-            "summary": st.column_config.TextColumn("Summary", width="large"),
-            "source_url": st.column_config.LinkColumn("Link", width="small", display_text="Open"),
-        },
-        hide_index=True,
-    )
+    render_feed(f)
 
 # --------------------------- Tab: Export ---------------------------
 with tab_export:
     st.subheader("Export Current View")
     export_cols = [c for c in ["date_ref","company","title","category","impact","source_url","summary"] if c in f.columns]
-    export_df = f.sort_values(by=["date_ref"], ascending=False)[export_cols].copy()
-    if "date_ref" in export_df.columns:
-        export_df["date_ref"] = pd.to_datetime(export_df["date_ref"], errors="coerce", utc=True).dt.strftime("%m-%d-%Y")
-    csv_bytes = export_df.to_csv(index=False).encode("utf-8")
+    export_df = f.reindex(columns=[c for c in export_cols if c != "date_ref"])
+    if "date_ref" in export_cols:
+        export_df.insert(0, "date_ref", f["_date_str"])
+    csv_bytes = _df_to_csv_bytes(export_df)
     fname = f"competitor_updates_{pd.Timestamp.now(tz='UTC').strftime('%Y-%m-%d')}.csv"
     if st.download_button("Download filtered rows as CSV", data=csv_bytes, file_name=fname, mime="text/csv", key="btn_export_csv"):
         log_user_action(get_client_ip(), "export_csv", f"Exported {len(export_df)} rows to CSV")
@@ -1734,8 +1933,7 @@ with tab_edits:
         st.info("Editing is disabled because we need both 'company' and 'source_url' columns to match rows.")
     else:
         edit_view = f[_key_cols + _edit_cols].copy()
-        for c in _edit_cols:
-            edit_view[c] = edit_view[c].astype(object).where(edit_view[c].notna(), "")
+        edit_view[_edit_cols] = edit_view[_edit_cols].astype(object).fillna("")
 
         st.caption("Tip: Filter above first, then edit only the rows you care about. Your changes save back to the enriched CSV.")
         edited = st.data_editor(
@@ -1760,7 +1958,23 @@ with tab_edits:
                 RAW_PATH = "data/updates.csv"
 
                 base_path = ENRICHED_PATH if os.path.exists(ENRICHED_PATH) else RAW_PATH
-                base_df = pd.read_csv(base_path)
+                # Everything as text, blanks kept as "": the file round-trips without NaN/float coercion.
+                # Arrow's multithreaded CSV reader; quoted values (clean_text) may span lines
+                import csv
+                import pyarrow as pa
+                import pyarrow.csv as pacsv
+
+                with open(base_path, "r", encoding="utf-8", newline="") as fh:
+                    header = next(csv.reader(fh), [])
+                base_df = pacsv.read_csv(
+                    base_path,
+                    parse_options=pacsv.ParseOptions(newlines_in_values=True),
+                    convert_options=pacsv.ConvertOptions(
+                        column_types={c: pa.string() for c in header},
+                        strings_can_be_null=False,
+                        quoted_strings_can_be_null=False,
+                    ),
+                ).to_pandas()
 
                 for k in _key_cols:
                     if k not in base_df.columns:
@@ -1775,20 +1989,25 @@ with tab_edits:
 
                 if "impact" in edited.columns:
                     allowed = {"High", "Medium", "Low", ""}
-                    edited["impact"] = edited["impact"].apply(lambda x: x if x in allowed else "")
+                    edited["impact"] = edited["impact"].where(edited["impact"].isin(allowed), "")
 
-                left  = base_df.set_index(_key_cols)
                 right = edited.set_index(_key_cols)[_edit_cols]
-                left.update(right)
-                merged_out = left.reset_index()
+                right = right[~right.index.duplicated(keep="last")]
+
+                # Hash-join on (company, source_url): each base row's position in `right` (-1 = untouched),
+                # then write the edited values straight into the base columns by position
+                pos = right.index.get_indexer(pd.MultiIndex.from_frame(base_df[_key_cols]))
+                hit = pos >= 0
+                for c in _edit_cols:
+                    col = base_df[c].to_numpy(dtype=object, copy=True)
+                    col[hit] = right[c].to_numpy(dtype=object)[pos[hit]]
+                    base_df[c] = col
 
-                tmp_path = ENRICHED_PATH + ".tmp"
-                merged_out.to_csv(tmp_path, index=False, encoding="utf-8")
-                os.replace(tmp_path, ENRICHED_PATH)
+                _atomic_write(ENRICHED_PATH, lambda fh: base_df.to_csv(fh, index=False, encoding="utf-8", lineterminator="\n"))
 
                 st.success(f"Saved edits to {ENRICHED_PATH}")
                 log_user_action(client_ip, "manual_edit", f"Saved manual edits to {ENRICHED_PATH}")
-                st.cache_data.clear()
+                load_data.clear()
                 st.rerun()
             except Exception as e:
                 st.error(f"Failed to save edits: {e}")
@@ -1813,17 +2032,27 @@ with tab_summary:
 
     cc1, cc2 = st.columns([1, 1])
     with cc1:
-        gen_click = st.button("Generate Executive Summary", key="btn_exec_generate")
+        # Nothing to summarize: disable up front instead of running the generate path
+        gen_click = st.button("Generate Executive Summary", key="btn_exec_generate", disabled=f.empty,
+                              help="No data in the current filter selection." if f.empty else None)
     with cc2:
-        if st.session_state["exec_blocks"]:
-            pdf_bytes = exec_blocks_to_pdf(st.session_state["exec_blocks"], dr_label)
+        # The PDF is only rendered on request ("Prepare PDF"), not on every rerun of this page;
+        # the prepared bytes are kept per date-range label and dropped when a new summary is generated
+        prepared_pdf = st.session_state.get("exec_pdf")
+        if st.session_state["exec_blocks"] and prepared_pdf and prepared_pdf[0] == dr_label:
             st.download_button(
                 "Download PDF",
-                data=pdf_bytes,
+                data=prepared_pdf[1],
                 file_name=f"exec_summary_{pd.Timestamp.now(tz='UTC').strftime('%Y%m%d_%H%M')}.pdf",
                 mime="application/pdf",
                 key="btn_exec_pdf",
             )
+        elif st.session_state["exec_blocks"]:
+            if st.button("Prepare PDF", key="btn_exec_pdf_prepare"):
+                with st.spinner("Rendering PDF…"):
+                    blocks_json = json.dumps(st.session_state["exec_blocks"], default=str, sort_keys=True)
+                    st.session_state["exec_pdf"] = (dr_label, _exec_pdf_cached(blocks_json, dr_label))
+                st.rerun()
         else:
             st.download_button(
                 "Download PDF",
@@ -1838,9 +2067,7 @@ with tab_summary:
         # Build blocks from the CURRENT filtered frame (f)
         log_user_action(get_client_ip(), "exec_summary_gen", f"Generating executive summary for {len(f)} rows")
 
-        # Check if there's data to process
-        companies = f["company"].nunique() if not f.empty else 0
-        if companies == 0:
+        if f.empty:
             st.warning("No data to generate summary from. Try adjusting your filters.")
         else:
             # Show progress bar
@@ -1855,6 +2082,7 @@ with tab_summary:
 
             blocks = build_exec_blocks(f, max_highlights=3, progress_callback=update_progress)
             st.session_state["exec_blocks"] = blocks
+            st.session_state.pop("exec_pdf", None)
 
             # Clear progress indicators
             progress_bar.empty()